@@ -1,73 +1,167 @@
+import ast
 import json
-import fire
+import signal
 import sys
+from typing import List, Dict, Tuple
 
-from .py_ankiconnect import PyAnkiconnect
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+from .py_ankiconnect import PyAnkiconnect, AnkiConnectError
 
-__all__ = ["PyAnkiconnect"]
+
+__all__ = ["PyAnkiconnect", "AnkiConnectError"]
 
 __VERSION__ = PyAnkiconnect.VERSION
 
+class _BarewordsToStr(ast.NodeTransformer):
+    "Turn the bare names of a parsed value into str, like fire does."
+    def visit_Name(self, node: ast.Name) -> ast.Constant:
+        return ast.copy_location(ast.Constant(node.id), node)
+
+
+def _parse_value(value: str):
+    """
+    Parse a command line value the way fire does: python literals are
+    evaluated and barewords are kept as str, so that for example
+    `--modelNames [Clozolkor]` gives `["Clozolkor"]`.
+    """
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        pass
+    try:
+        tree = _BarewordsToStr().visit(ast.parse(value, mode="eval"))
+        return ast.literal_eval(tree)
+    except (ValueError, SyntaxError):
+        return value
+
+
+def _parse_argv(argv: List[str]) -> Tuple[List, Dict]:
+    """
+    Split the command line arguments into args and kwargs. Supports
+    `--key value`, `--key=value` and `--flag` (which is set to True).
+    This is much cheaper than asking fire to do it.
+    """
+    args = []
+    kwargs = {}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg.startswith("--") and len(arg) > 2:
+            key, sep, value = arg[2:].partition("=")
+            if sep:
+                kwargs[key] = _parse_value(value)
+            elif i + 1 < len(argv) and not argv[i + 1].startswith("--"):
+                kwargs[key] = _parse_value(argv[i + 1])
+                i += 1
+            else:
+                kwargs[key] = True
+        else:
+            args.append(_parse_value(arg))
+        i += 1
+    return args, kwargs
+
+
+_MARKDOWN_MARKERS = ("# ", "```", "**")
+_console = None
+
+
+def _get_console():
+    "Create the rich Console only once as it has to detect the terminal."
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
 def cli_launcher() -> None:
-    args, kwargs = fire.Fire(
-        lambda *args, **kwargs: [args, kwargs]
-    )
-
-    # fire replaces notes to "tes" because it removes leading no
-    for keyword in ["notes", "notetypes"]:
-        if keyword[2:] in kwargs:
-            kwargs[keyword] = kwargs[keyword[2:]]
-            del kwargs[keyword[2:]]
-
-    # if "-" is in sys.argv, parse the last line of stdin as a json output
-    if "-" in sys.argv:
-        target_key = sys.argv[sys.argv.index("-") - 1][2:]
-        import signal
+    # let the kernel end the process quietly when a pipe is closed, for
+    # example by `| head`. Not available on windows.
+    if hasattr(signal, "SIGPIPE"):
         signal.signal(signal.SIGPIPE, signal.SIG_DFL)
-        piped_lines = []
-        try:
-            for line in sys.stdin:
-                piped_lines.append(line)
-        except BrokenPipeError:
-            # Handle the error gracefully
-            sys.stderr.close()
-        piped_lines = [p.strip() for p in piped_lines if p.strip()]
-
-        if piped_lines:
+
+    args, kwargs = _parse_argv(sys.argv[1:])
+
+    # if a --key is given "-" as value, parse the last line of stdin as a json output
+    target_key = next((k for k, v in kwargs.items() if v == "-"), None)
+    if target_key is not None:
+        # read everything at once, only the last non empty line is used
+        piped = sys.stdin.buffer.read()
+        raw_line = piped.rstrip().rpartition(b"\n")[2].strip()
+        last_line = raw_line.decode("utf-8")
+
+        if last_line:
+            forward_raw = len(kwargs) == 1
             try:
-                piped_values = json.loads(piped_lines[-1])
+                if orjson is not None:
+                    piped_values = orjson.loads(last_line)
+                else:
+                    piped_values = json.loads(last_line)
             except Exception:
-                piped_values = piped_lines[-1]
+                piped_values = last_line
+                forward_raw = False
             # if it's a list and contains only str that looks like int, cast as it (for example --notes)
-            if isinstance(piped_values, list):
+            # json already parses [1, 2] as int so only lists of str need the check
+            if isinstance(piped_values, list) and piped_values and not isinstance(piped_values[0], int):
                 if all(str(val).isdigit() for val in piped_values):
                     piped_values = [int(val) for val in piped_values]
-            assert kwargs[target_key] is False
-            kwargs[target_key] = piped_values
+                    forward_raw = False
+            if forward_raw:
+                # stdin is already valid json, send it as is instead of
+                # serializing it again
+                kwargs = {
+                    "_raw_params_json": b"{" + json.dumps(target_key).encode("utf-8")
+                    + b":" + raw_line + b"}"
+                }
+            else:
+                kwargs[target_key] = piped_values
 
-    if "help" in args or ("help" in kwargs and kwargs["help"]):
+    if "help" in args or kwargs.get("help"):
+        doc = PyAnkiconnect.__doc__ or ""
         try:
-            # if possible use rich because it's in markdown
-            from rich.console import Console
+            # if possible use rich because it's in markdown, but only import
+            # it if there is some markdown to render
+            if not any(marker in doc for marker in _MARKDOWN_MARKERS):
+                raise ValueError("No markdown to render")
             from rich.markdown import Markdown
-            console = Console()
-            md = Markdown(PyAnkiconnect.__doc__)
-            console.print(md)
+            md = Markdown(doc)
+            _get_console().print(md)
         except Exception:
             # print it
-            print(PyAnkiconnect.__doc__)
-            # open the pager
+            print(doc)
+            # open the pager, fire is imported here as it is only needed
+            # for its help
+            import fire
             fire.Fire(PyAnkiconnect)
     else:
         akc = PyAnkiconnect()
-        out = akc(*args, **kwargs)
-        try:
-            out = json.dumps(out, ensure_ascii=False, pretty=False)
-        except Exception:
-            pass
+        # the json of the result is written as is when it can, instead of
+        # being parsed and dumped again. It is always written the way
+        # AnkiConnect formats it, with spaces after the separators
+        out = akc(*args, _raw_result=True, **kwargs)
+        if isinstance(out, bytes) and (out.startswith(b'"') or b"\\u" in out):
+            # parsed after all: a str is written without its quotes, and
+            # escaped non ascii chars are written back as they are
+            out = orjson.loads(out) if orjson is not None else json.loads(out)
+        if isinstance(out, str):
+            # no need to dump it, and that would only add quotes around it
+            dumped = out.encode("utf-8", "surrogatepass") + b"\n"
+        elif isinstance(out, bytes):
+            dumped = out + b"\n"
+        else:
+            dumped = json.dumps(out, ensure_ascii=False, default=str).encode("utf-8", "surrogatepass") + b"\n"
         try:
-            print(out)
+            try:
+                # write the bytes directly instead of having print encode
+                # the whole output a second time
+                sys.stdout.buffer.write(dumped)
+            except AttributeError:
+                # no binary buffer, for example in jupyter
+                print(dumped.decode("utf-8", "surrogatepass"), end="")
         except Exception:
             return out
 
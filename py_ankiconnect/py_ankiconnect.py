@@ -1,24 +1,240 @@
-from pathlib import Path
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Optional, Tuple, Awaitable, AsyncIterator, Callable
 import json
+import os
 from urllib.error import URLError
+from urllib.parse import unquote, urlsplit
 import asyncio
+import concurrent.futures
+import contextlib
+import atexit
+import difflib
+import functools
+import gzip
+import threading
+import time
 import aiohttp
-from functools import wraps
+import yarl
 
-from .help import docstring
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-class PyAnkiconnect:
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# the request envelope is fixed so it is built by concatenating bytes
+# instead of serializing a new dict for each call
+_ACTION_PREFIX = b'{"action":"'
+_PARAMS_MID = b'","version":6,"params":'
+_SUFFIX = b'}'
+
+_SENTINEL = object()
+
+# encoded action names, only holds ascii identifiers
+_ACTION_BYTES: Dict[str, bytes] = {}
+
+# the only fields of a response of AnkiConnect
+_EXPECTED_KEYS = frozenset({"result", "error"})
+# a successful response as written by AnkiConnect's json.dumps is
+# exactly the json of the result between these
+_RAW_RESULT_PREFIX = b'{"result": '
+_RAW_RESULT_SUFFIX = b', "error": null}'
+
+# with compress=True, request bodies larger than this are gzipped
+_COMPRESS_MIN_SIZE = 16384
+_GZIP_HEADERS = {"Content-Encoding": "gzip"}
+
+# actions whose result only changes when the collection is edited, their
+# results can be cached with cache_ttl
+_CACHEABLE_ACTIONS = frozenset({
+    "getTags",
+    "deckNames",
+    "deckNamesAndIds",
+    "getDecks",
+    "getDeckConfig",
+    "modelNames",
+    "modelNamesAndIds",
+    "modelFieldNames",
+    "modelFieldDescriptions",
+    "modelFieldsOnTemplates",
+    "modelTemplates",
+    "modelStyling",
+    "findModelsById",
+    "findModelsByName",
+    "getProfiles",
+    "version",
+    "apiReflect",
+})
+_CACHE_MAXSIZE = 256
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+# the sync calls of all instances share these sessions, one per socket path
+# (None for tcp)
+_background_sessions: Dict[Optional[str], aiohttp.ClientSession] = {}
+_forked_sessions: List[aiohttp.ClientSession] = []
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop used by the sync calls, running forever in a
+    daemon thread. It is shared by all instances and started on first use.
+    Uses uvloop if it is installed.
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            if uvloop is not None:
+                _background_loop = uvloop.new_event_loop()
+            else:
+                _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever,
+                name="py_ankiconnect",
+                daemon=True,
+            ).start()
+    return _background_loop
+
+
+def _stop_background_loop() -> None:
+    "Close the sessions of the background loop and stop it, called at exit."
+    if _background_loop is None:
+        return
+    for session in _background_sessions.values():
+        if not session.closed:
+            asyncio.run_coroutine_threadsafe(session.close(), _background_loop).result()
+    _background_loop.call_soon_threadsafe(_background_loop.stop)
+
+
+def _reset_background_loop() -> None:
+    """
+    Forget the background loop in a forked child: its thread is not running
+    there, so the child starts its own loop on its first sync call.
+    """
+    global _background_loop, _background_loop_lock, _background_sessions
+    # the inherited sessions can't be closed without their loop, keep them
+    # referenced so they don't warn about being unclosed when collected
+    _forked_sessions.extend(_background_sessions.values())
+    _background_loop = None
+    _background_loop_lock = threading.Lock()
+    _background_sessions = {}
+
+
+atexit.register(_stop_background_loop)
+if hasattr(os, "register_at_fork"):
+    # not available on windows, which can't fork anyway
+    os.register_at_fork(after_in_child=_reset_background_loop)
+
+
+class AnkiConnectError(Exception):
+    """
+    An error returned by AnkiConnect, kept in the error attribute. The
+    message is only formatted when the exception is displayed.
+    """
+
+    def __init__(self, error, template: str = "Received error: '{error}'") -> None:
+        super().__init__(error)
+        self.error = error
+        self.template = template
+
+    def __str__(self) -> str:
+        return self.template.format(error=self.error)
+
+
+def _tolist(obj) -> List:
+    "Let json serialize numpy arrays and scalars, as orjson does natively."
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# bound once so that the calls don't check for orjson each time
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps_params = functools.partial(
+        orjson.dumps,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+else:
+    _loads = json.loads
+
+    def _dumps_params(params: Dict) -> bytes:
+        return json.dumps(params, default=_tolist).encode('utf-8')
+
+
+def _build_url(host: str, port: int) -> yarl.URL:
+    """
+    Build the url of AnkiConnect, the scheme of host defaults to http. The
+    user, password and path of host are kept, for example for a proxy.
+    """
+    parts = urlsplit(host if "://" in host else f"http://{host}")
+    hostname = parts.hostname
+    if hostname == "localhost" and parts.scheme == "http":
+        # AnkiConnect listens on 127.0.0.1 by default: skip the name
+        # resolution, that can also try ::1 first. Not with https, whose
+        # certificate is checked against the host name
+        hostname = "127.0.0.1"
+    return yarl.URL.build(
+        scheme=parts.scheme,
+        user=None if parts.username is None else unquote(parts.username),
+        password=None if parts.password is None else unquote(parts.password),
+        host=hostname,
+        port=int(port),
+        path=unquote(parts.path),
+    )
+
+
+class _LazyDocMeta(type):
+    # The docstring of PyAnkiconnect is the whole AnkiConnect documentation,
+    # so it is only read from help.md when PyAnkiconnect.__doc__ is accessed.
+    @property
+    def __doc__(cls) -> str:
+        from . import help
+        return help.docstring
+
+
+class PyAnkiconnect(metaclass=_LazyDocMeta):
     VERSION: str = "1.1.0"
+    __slots__ = (
+        "host",
+        "port",
+        "_default_url",
+        "force_async_mode",
+        "timeout",
+        "concurrency_limit",
+        "socket_path",
+        "cache_ttl",
+        "_cache",
+        "coalesce",
+        "compress",
+        "check_actions",
+        "_envelope_cache",
+        "_inflight",
+        "_semaphores",
+        "_sessions",
+        "__weakref__",
+    )
 
     def __init__(
         self,
         default_host: str = "http://127.0.0.1",
         default_port: int = 8765,
         force_async_mode: bool = False,
-        timeout: int = 10,
+        timeout: Optional[int] = None,
         concurrency_limit: int = 50,
+        default_socket_path: Optional[str] = None,
+        cache_ttl: float = 0,
+        coalesce: bool = False,
+        compress: bool = False,
+        check_actions: bool = False,
         ) -> None:
         """
         Initialize a PyAnkiconnect instance.
@@ -32,19 +248,54 @@ class PyAnkiconnect:
         force_async_mode : bool, optional
             Flag to always use asynchronous mode. Defaults to False, meaning
             that we use sync or async depending on the caller.
-        timeout : int, default 10
-            Nb of second to wait for the result when __sync_call__ decides to call
-            async on its own (because it detects we are called in an async environment)
+        timeout : int, optional, default None
+            Nb of seconds to wait for the result of a sync call, that runs in
+            the background event loop, before raising a TimeoutError. For
+            bulk, it covers all the chunks. Anki might still run the action
+            after that. None, the default, waits as long as the action takes,
+            as some like sync or exportPackage can be long. Async calls are
+            not limited.
         concurrency_limit: int, default 50
             Limit the number of concurrent thread using asyncio.semaphore
+        default_socket_path: str, optional
+            Path of a unix domain socket to connect to instead of the tcp
+            port. The host and port are then only used in the url. Defaults
+            to None.
+        cache_ttl: float, default 0
+            Nb of seconds during which the results of read only actions like
+            getTags or deckNames are cached. Any other action clears the
+            cache, as it might edit the collection, and so does
+            invalidate_cache(). Cached results are returned as is, so they
+            should not be modified. 0 disables the cache.
+        coalesce: bool, default False
+            If True, identical calls made while the same call is running
+            get its result instead of sending a request of their own. They
+            then share the same result object. Only use it if you never
+            send twice the same call on purpose.
+        compress: bool, default False
+            If True, gzip request bodies larger than 16kB. AnkiConnect itself
+            doesn't accept them, this is meant for a proxy in front of it
+            that does. If the server refuses the encoding with a 400 or 415
+            status, the request is sent again uncompressed and compression
+            is disabled.
+        check_actions: bool, default False
+            If True, raise before sending an action that is not in the
+            bundled documentation, suggesting the close matches, to catch
+            typos. The documentation can lag behind AnkiConnect, so this is
+            off by default. Reads the documentation on the first call.
 
         Attributes:
         -----------
         host : str
         port : int
         force_async_mode : bool
-        timeout : int
+        timeout : Optional[int]
         concurrency_limit: int
+        socket_path: Optional[str]
+        cache_ttl: float
+        coalesce: bool
+        compress: bool
+        check_actions: bool
         semaphore: asyncio.Semaphore
 
         Returns:
@@ -53,10 +304,26 @@ class PyAnkiconnect:
         """
         self.host: str = default_host
         self.port: int = default_port
+        # built once, aiohttp would otherwise parse a str on each request
+        self._default_url = _build_url(self.host, self.port)
         self.force_async_mode = force_async_mode
         self.timeout = timeout
         self.concurrency_limit = concurrency_limit
-        self.semaphore = asyncio.Semaphore(self.concurrency_limit)
+        self.socket_path = default_socket_path
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Tuple[str, yarl.URL, bytes], Tuple[float, Union[List, str]]] = {}
+        self.coalesce = coalesce
+        self.compress = compress
+        self.check_actions = check_actions
+        # request bodies of the actions called without params
+        self._envelope_cache: Dict[str, bytes] = {}
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, yarl.URL, bytes], asyncio.Future] = {}
+        # created on first use in each event loop, as a semaphore gets
+        # bound to the loop that first waits on it
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+        # keep-alive sessions opened by `async with`, one per event loop as
+        # a session can't be shared across loops
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
 
     def __call__(
         self,
@@ -73,32 +340,14 @@ class PyAnkiconnect:
         action: str,
         **params,
         ) -> Union[List, str]:
-        if not asyncio.iscoroutinefunction(asyncio.current_task):
-            loop = None
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                try:
-                    return asyncio.run(self.__async_call__(action=action, **params))
-                except RuntimeError:
-                    pass
-            try:
-                return self.__async_call__(action=action, **params)
-            except Exception:
-                pass
-
-            if loop is not None:
-                future = asyncio.run_coroutine_threadsafe(
-                        self.__async_call__(action=action, **params),
-                        loop,
-                    )
-                try:
-                    result = future.result(timeout=self.timeout)
-                    return result
-                except TimeoutError:
-                    raise Exception("Failed all ways to call sync or async_")
-        else:
-            return self.__async_call__(action=action, **params)
+        # returns None instead of raising when there is no running loop
+        loop = asyncio._get_running_loop()
+        if loop is None:
+            # run it in the background event loop, which is kept
+            # alive so that its session can be reused
+            return self._wait(self.__async_call__(action=action, **params))
+        # called from async code: return the coroutine to be awaited
+        return self.__async_call__(action=action, **params)
 
     async def __async_call__(
         self,
@@ -114,9 +363,22 @@ class PyAnkiconnect:
         -------
         - action: str, for example 'sync'
         - params: dict, any parameters supported by the action.
+            * numpy arrays, for example of note ids for "notes", are
+                accepted as is without converting them to lists.
             * With addition of "port" and "host" which,
                 if specified will overide (for this call only) the value
                 given at instanciation time.
+            * And "_skip_action_check" which, if True, sends actions that
+                are not in the documentation instead of raising, see
+                check_actions.
+            * And "_no_cache" which, if True, ignores the cached result of
+                the call and caches the new one, see cache_ttl.
+            * And "_raw_result" which, if True, returns the json of the
+                result as bytes, sliced from the response when possible
+                instead of parsing it. The cache and coalescing are skipped.
+            * And "_raw_params_json" which, if given the params already
+                serialized as json bytes, sends them as is instead of
+                serializing the params again.
 
         # How To
         ## Using the command line
@@ -157,17 +419,113 @@ class PyAnkiconnect:
         **To see all the supported actions, see this class's docstring instead.**
         """
 
-        if "host" in params:
-            host = params["host"]
-            del params["host"]
+        no_cache = params.pop("_no_cache", False)
+        raw_result = params.pop("_raw_result", False)
+        url, requestJson = self._prepare_request(action, params)
+
+        if raw_result:
+            return await self._send(url, requestJson, raw=True)
+
+        cache_key = None
+        if self.cache_ttl and action in _CACHEABLE_ACTIONS:
+            cache_key = (action, url, requestJson)
+            cached = None if no_cache else self._cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+        if self.coalesce:
+            # identical calls made while this one is running wait for its
+            # result instead of sending their own request
+            key = (asyncio.get_running_loop(), url, requestJson)
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                inflight = asyncio.ensure_future(self._send(url, requestJson))
+                self._inflight[key] = inflight
+                inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+            result = await asyncio.shield(inflight)
         else:
-            host = self.host
-        if "port" in params:
-            port = params["port"]
-            del params["port"]
+            result = await self._send(url, requestJson)
+
+        if cache_key is not None:
+            if len(self._cache) >= _CACHE_MAXSIZE:
+                # drop the oldest entry
+                del self._cache[next(iter(self._cache))]
+            self._cache[cache_key] = (time.monotonic() + self.cache_ttl, result)
+        return result
+
+    async def acall(
+        self,
+        action: str,
+        **params,
+    ) -> Union[List, str]:
+        """
+        Same as awaiting __call__ but always async, whatever the value of
+        force_async_mode, for example in
+        `await asyncio.gather(*[akc.acall("notesInfo", notes=[n]) for n in ids])`.
+        Each call opens its own connection, unless made inside
+        `async with akc:` which keeps one alive for the calls of the block.
+        """
+        return await self.__async_call__(action, **params)
+
+    # set once at class definition
+    __call__.__doc__ = __sync_call__.__doc__ = __async_call__.__doc__
+
+    async def _send(
+        self,
+        url: yarl.URL,
+        requestJson: bytes,
+        raw: bool = False,
+    ) -> Union[List, str, bytes]:
+        """
+        Send the request and return the result after checking the response.
+        If raw, return the json of the result as bytes.
+        """
+        try:
+            body = await self._async_request(url, requestJson)
+        except (ConnectionRefusedError, URLError, aiohttp.ClientError) as e:
+            raise Exception(
+                f"Error: '{str(e)}': is Anki open? is ankiconnect enabled? "
+                f"is your firewall configured? Address is '{url}'"
+            )
+
+        if raw and body.startswith(_RAW_RESULT_PREFIX) and body.endswith(_RAW_RESULT_SUFFIX):
+            # a successful response as formatted by AnkiConnect: the result
+            # is sliced out of it without parsing it
+            return body[len(_RAW_RESULT_PREFIX):-len(_RAW_RESULT_SUFFIX)]
+
+        try:
+            response = _loads(body)
+        except Exception as err:
+            raise Exception(f"Failed to decode json output of response: '{err}'")
+
+        # valid json that isn't an object, for example from a proxy, is
+        # reported the same way
+        if not isinstance(response, dict) or response.keys() != _EXPECTED_KEYS:
+            raise Exception(
+                'Response should only have the fields "result" and "error": '
+                f'"{response}"'
+            )
+        if response['error'] is not None:
+            raise AnkiConnectError(response['error'])
+
+        if raw:
+            # formatted like AnkiConnect does, but without escaping non ascii
+            return json.dumps(response['result'], ensure_ascii=False).encode("utf-8", "surrogatepass")
+        return response['result']
+
+    def invalidate_cache(self, action: Optional[str] = None) -> None:
+        "Forget the cached results, only those of action if given, see cache_ttl."
+        if action is None:
+            self._cache.clear()
         else:
-            port = self.port
-        if "async_mode" in params:
+            for key in [key for key in self._cache if key[0] == action]:
+                del self._cache[key]
+
+    def _prepare_request(self, action: str, params: Dict) -> Tuple[yarl.URL, bytes]:
+        "Pop the call options from params and build the url and the request body."
+        host = params.pop("host", None)
+        port = params.pop("port", None)
+        if params.pop("async_mode", _SENTINEL) is not _SENTINEL:
             raise Exception(
                 "async_mode can only be used when instantiating the class, "
                 "not when calling with it."
@@ -183,54 +541,507 @@ class PyAnkiconnect:
         #         params["cards"] = [int(n) for n in json.loads(params["cards"])]
         #     except Exception:
         #         pass
-        address: str = f"{host}:{port}"
+        if host is None and port is None:
+            url = self._default_url
+        else:
+            url = _build_url(host or self.host, port or self.port)
 
-        requestJson: bytes = json.dumps(
-            {
-                'action': action,
-                'params': params,
-                'version': 6
-            }
-        ).encode('utf-8')
+        if self.cache_ttl and action not in _CACHEABLE_ACTIONS:
+            # done before any request is sent, whatever the way it is sent,
+            # as the action might change what the cached results were about
+            self.invalidate_cache()
 
+        if not params:
+            # calls without params always send the same bytes
+            requestJson = self._envelope_cache.get(action)
+            if requestJson is not None:
+                return url, requestJson
+
+        skip_check = params.pop("_skip_action_check", False)
+        if self.check_actions and not skip_check:
+            from .help import known_actions
+            known = known_actions()
+            # without the help, leave it to AnkiConnect to complain
+            if known and action not in known:
+                close = difflib.get_close_matches(action, known, n=3)
+                raise Exception(
+                    f"Unknown AnkiConnect action: '{action}'."
+                    + (f" Did you mean {close}?" if close else "")
+                    + " Use _skip_action_check=True to send it anyway."
+                )
+        actionJson = _ACTION_BYTES.get(action)
+        if actionJson is None:
+            if action.isascii() and action.isidentifier():
+                # nothing to escape, it is written as is in the json
+                actionJson = action.encode("ascii")
+                _ACTION_BYTES[action] = actionJson
+            else:
+                # escaped by json, without the quotes that are in the envelope
+                actionJson = json.dumps(action)[1:-1].encode()
+        paramsJson: Optional[bytes] = params.pop("_raw_params_json", None)
+        if paramsJson is not None:
+            if params:
+                raise Exception(
+                    "_raw_params_json already contains all the params, it "
+                    f"can't be used along with {list(params)}"
+                )
+        else:
+            paramsJson = _dumps_params(params)
+        requestJson = (
+            _ACTION_PREFIX + actionJson + _PARAMS_MID + paramsJson + _SUFFIX
+        )
+        if paramsJson == b"{}" and not skip_check:
+            self._envelope_cache[action] = requestJson
+        return url, requestJson
+
+    async def call_streaming(
+        self,
+        action: str,
+        **params,
+        ) -> AsyncIterator:
+        """
+        Like __async_call__ but yield the items of the result list one at a
+        time as the response is received, instead of loading the whole
+        response at once. Meant for actions with large results like
+        notesInfo, cardsInfo or findNotes. Needs ijson to be installed.
+
+        async for note in akc.call_streaming("notesInfo", notes=note_ids):
+            ...
+        """
+        if ijson is None:
+            raise Exception("call_streaming needs ijson: pip install ijson")
+        url, requestJson = self._prepare_request(action, params)
+        error = None
         try:
-            response: Dict = await self._async_request(address, requestJson)
+            async with self.semaphore, self._session() as session, session.post(url, data=requestJson) as response:
+                if response.status != 200:
+                    raise Exception(f"Status code of response is not 200 but {response.status}")
+                builder = None
+                depth = 0
+                async for prefix, event, value in ijson.parse(response.content, use_float=True):
+                    if prefix == "error":
+                        if event != "null":
+                            error = value
+                        continue
+                    if prefix != "result.item" and not prefix.startswith("result.item."):
+                        continue
+                    if builder is None:
+                        builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    if event in ("start_map", "start_array"):
+                        depth += 1
+                    elif event in ("end_map", "end_array"):
+                        depth -= 1
+                    if depth == 0:
+                        yield builder.value
+                        builder = None
         except (ConnectionRefusedError, URLError, aiohttp.ClientError) as e:
             raise Exception(
                 f"Error: '{str(e)}': is Anki open? is ankiconnect enabled? "
-                f"is your firewall configured? Address is '{address}'"
+                f"is your firewall configured? Address is '{url}'"
             )
+        if error is not None:
+            raise AnkiConnectError(error)
 
-        if len(response) != 2:
-            raise Exception(
-                'Response has an unexpected number of fields: '
-                f'{len(response)}, expected 2'
+    def call_many(
+        self,
+        calls: List[Tuple[str, Dict]],
+        return_exceptions: bool = False,
+        ) -> Union[List, Awaitable[List]]:
+        """
+        Run several actions in a single round trip using AnkiConnect's
+        'multi' action. Follows the sync/async mode of __call__.
+
+        Params:
+        -------
+        - calls: list of (action, params) tuples
+        - return_exceptions: bool, default False. If True, the actions that
+            returned an error get an Exception in place of their result
+            instead of raising.
+
+        Returns:
+        --------
+        The list of results, in the same order as calls. An exception is
+        raised if any of the actions returned an error, unless
+        return_exceptions is True.
+        """
+        result = self("multi", actions=_multi_actions(calls))
+        if asyncio.iscoroutine(result):
+            async def unwrap() -> List:
+                return _unwrap_multi(await result, return_exceptions)
+            return unwrap()
+        return _unwrap_multi(result, return_exceptions)
+
+    async def gather(self, calls: List[Tuple[str, Dict]]) -> List:
+        """
+        Run several actions concurrently, each in its own request, within
+        the concurrency_limit of the instance. The requests share a
+        keep-alive connection only inside `async with akc:`. Unlike
+        call_many, each action also goes through the cache and coalescing.
+
+        Params:
+        -------
+        - calls: list of (action, params) tuples
+
+        Returns:
+        --------
+        The list of results, in the same order as calls.
+        """
+        return await asyncio.gather(
+            *(self.__async_call__(action, **params) for action, params in calls)
+        )
+
+    def bulk(
+        self,
+        action: str,
+        list_param: str,
+        items: List,
+        chunk_size: int = 500,
+        **params,
+        ) -> Union[List, Awaitable[List]]:
+        """
+        Call action on items split in chunks of chunk_size, given as the
+        list_param parameter, for example
+        `akc.bulk("notesInfo", "notes", note_ids)` or
+        `akc.bulk("addNotes", "notes", notes, chunk_size=100)`.
+        The chunks are sent concurrently, within concurrency_limit, which
+        keeps each request small instead of a huge one blocking Anki.
+        Follows the sync/async mode of __call__. The chunks share a
+        keep-alive connection in sync mode, and in async mode only inside
+        `async with akc:`.
+
+        Returns:
+        --------
+        The results of the chunks concatenated, in the order of items, when
+        each of them is a list. Otherwise, for actions like deleteNotes that
+        return None, the list of the result of each chunk.
+        """
+        return self._run(self._bulk(action, list_param, items, chunk_size, params))
+
+    def _run(self, coro: Awaitable) -> Union[List, str, Awaitable]:
+        "Run coro in the sync/async mode of __call__."
+        if self.force_async_mode or asyncio._get_running_loop() is not None:
+            return coro
+        return self._wait(coro)
+
+    def _wait(self, coro: Awaitable) -> Union[List, str]:
+        "Run coro in the background event loop and wait timeout for its result."
+        future = asyncio.run_coroutine_threadsafe(coro, _get_background_loop())
+        try:
+            return future.result(timeout=self.timeout)
+        except concurrent.futures.TimeoutError:
+            # not the builtin TimeoutError before python 3.11
+            future.cancel()
+            raise TimeoutError(
+                f"No result from AnkiConnect after {self.timeout}s"
+            ) from None
+
+    async def _bulk(
+        self,
+        action: str,
+        list_param: str,
+        items: List,
+        chunk_size: int,
+        params: Dict,
+    ) -> List:
+        results = await asyncio.gather(*(
+            self.__async_call__(action, **params, **{list_param: items[i:i + chunk_size]})
+            for i in range(0, len(items), chunk_size)
+        ))
+        if not all(isinstance(chunk, list) for chunk in results):
+            return results
+        return [r for chunk in results for r in chunk]
+
+    def specialize(
+        self,
+        action: str,
+        param_names: List[str],
+        ) -> Callable[..., Union[List, str, Awaitable]]:
+        """
+        Return a function calling action with the values of param_names as
+        positional arguments, for loops calling the same action many times:
+
+        add_note = akc.specialize("addNote", ["note"])
+        for note in notes:
+            add_note(note)
+
+        The action is checked and the fixed parts of the request are
+        encoded once, each call then only serializes the values. Follows
+        the sync/async mode of __call__, but doesn't read the cache nor
+        coalesce. A call to an action that isn't cached still invalidates the
+        cache, see cache_ttl.
+        """
+        # checks the action if check_actions and gives the envelope of a
+        # call without params
+        url, emptyJson = self._prepare_request(action, {})
+        prefix = emptyJson[:-len(b"{}" + _SUFFIX)] + b"{"
+        keys = [
+            (b"," if i else b"") + json.dumps(name).encode() + b":"
+            for i, name in enumerate(param_names)
+        ]
+        end = b"}" + _SUFFIX
+        cacheable = action in _CACHEABLE_ACTIONS
+
+        def call(*values) -> Union[List, str, Awaitable]:
+            if len(values) != len(keys):
+                raise TypeError(f"{action} expects the values of {param_names}, got {len(values)} values")
+            if self.cache_ttl and not cacheable:
+                self.invalidate_cache()
+            requestJson = prefix + b"".join(
+                key + _dumps_params(value) for key, value in zip(keys, values)
+            ) + end
+            return self._run(self._send(url, requestJson))
+
+        return call
+
+    def batch(self, delay: float = 0.002) -> "BatchCollector":
+        """
+        Return a BatchCollector, a context manager sending the calls made
+        on it as one 'multi'. In async code, the calls made within `delay`
+        seconds of each other are grouped:
+
+        async with akc.batch() as b:
+            tags, notes = await asyncio.gather(b("getTags"), b("findNotes", query="deck:x"))
+
+        In sync code, all the calls of the block are sent when leaving it:
+
+        with akc.batch() as b:
+            tags = b("getTags")
+            notes = b("findNotes", query="deck:x")
+        print(tags.result(), notes.result())
+        """
+        return BatchCollector(self, delay=delay)
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        "The semaphore limiting the concurrent requests in the running event loop."
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # forget the loops that were closed, like those of past asyncio.run
+            for old_loop in [l for l in self._semaphores if l.is_closed()]:
+                del self._semaphores[old_loop]
+            semaphore = asyncio.Semaphore(self.concurrency_limit)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        if self.socket_path is not None:
+            connector = aiohttp.UnixConnector(
+                path=self.socket_path,
+                limit=self.concurrency_limit,
+                keepalive_timeout=60,
             )
-        if 'error' not in response:
-            raise Exception(
-                f'Response is missing the "error" field: "{response}"')
-        if 'result' not in response:
-            raise Exception(
-                f'Response is missing the "result" field: "{response}"')
-        if response['error'] is not None:
-            raise Exception(f"Received error: '{response['error']}'")
+        else:
+            connector = aiohttp.TCPConnector(
+                limit=self.concurrency_limit,
+                keepalive_timeout=60,
+            )
+        return aiohttp.ClientSession(connector=connector)
+
+    def _get_session(self) -> Optional[aiohttp.ClientSession]:
+        """
+        Return the keep-alive session of the running event loop, or None if
+        there is none and each request has to open its own.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is _background_loop:
+            # shared by all instances so that it outlives them and is
+            # closed at exit
+            session = _background_sessions.get(self.socket_path)
+            if session is None or session.closed:
+                session = self._new_session()
+                _background_sessions[self.socket_path] = session
+            return session
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            return None
+        return session
+
+    @contextlib.asynccontextmanager
+    async def _session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        session = self._get_session()
+        if session is not None:
+            yield session
+            return
+        async with self._new_session() as session:
+            yield session
+
+    async def aclose(self) -> None:
+        "Close the session of the running event loop."
+        loop = asyncio.get_running_loop()
+        self._semaphores.pop(loop, None)
+        session = self._sessions.pop(loop, None)
+        if session is not None:
+            await session.close()
+
+    async def __aenter__(self) -> "PyAnkiconnect":
+        "Keep the connection alive in the running event loop until aclose."
+        loop = asyncio.get_running_loop()
+        for old_loop in [l for l in self._sessions if l.is_closed()]:
+            del self._sessions[old_loop]
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            self._sessions[loop] = self._new_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _async_request(self, url: yarl.URL, requestJson: bytes) -> bytes:
+        # the semaphore covers the whole request so that it does limit the
+        # number of requests in flight
+        async with self.semaphore:
+            return await self._post(url, requestJson)
+
+    async def _post(self, url: yarl.URL, requestJson: bytes) -> bytes:
+        async with self._session() as session:
+            return await self._post_with(session, url, requestJson)
+
+    async def _post_with(
+        self,
+        session: aiohttp.ClientSession,
+        url: yarl.URL,
+        requestJson: bytes,
+        ) -> bytes:
+        if self.compress and len(requestJson) > _COMPRESS_MIN_SIZE:
+            async with session.post(
+                url,
+                data=gzip.compress(requestJson, compresslevel=1),
+                headers=_GZIP_HEADERS,
+            ) as response:
+                if response.status not in (400, 415):
+                    return await self._read_body(response)
+            # the server doesn't accept compressed requests, stop trying.
+            # Other errors are raised as is, as the server might have
+            # acted on the request
+            self.compress = False
+        async with session.post(url, data=requestJson) as response:
+            return await self._read_body(response)
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        if response.status != 200:
+            raise Exception(f"Status code of response is not 200 but {response.status}")
+        # read bytes as both json and orjson can parse them
+        # directly, skipping aiohttp's decoding to str
+        return await response.read()
+
+def _multi_actions(calls: List[Tuple[str, Dict]]) -> List[Dict]:
+    # the version is set for each action so that every result comes
+    # with its own error field
+    return [
+        {"action": action, "params": params, "version": 6}
+        for action, params in calls
+    ]
 
-        return response['result']
 
+def _unwrap_multi(results: List[Dict], return_exceptions: bool = False) -> List:
+    # the whole response was parsed once, the results are only picked from it
+    if return_exceptions:
+        return [
+            r["result"] if r["error"] is None
+            else AnkiConnectError(r["error"])
+            for r in results
+        ]
+    errors = [r["error"] for r in results if r["error"] is not None]
+    if errors:
+        raise AnkiConnectError(errors, "Received errors: '{error}'")
+    return [r["result"] for r in results]
 
-    async def _async_request(self, address: str, requestJson: bytes) -> Dict:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(address, data=requestJson) as response:
-                assert response.ok, f"Status of response is not True but {response.ok}"
-                assert response.status == 200, f"Status code of response is not 200 but {response.ok}"
-                async with self.semaphore:
-                    text = await response.text()
+
+class BatchCollector:
+    """
+    Context manager that queues the calls made on it and sends them as a
+    single 'multi' action, see PyAnkiconnect.batch. Each call returns a
+    future of its own result.
+    Used with `async with`, the calls are sent after a small delay and
+    return asyncio futures to await. Used with `with`, the calls are sent
+    when leaving the block and return concurrent.futures.Future whose
+    .result() can be read after it.
+    """
+
+    __slots__ = ("akc", "delay", "_pending", "_flush_task", "_sync_pending")
+
+    def __init__(self, akc: PyAnkiconnect, delay: float = 0.002) -> None:
+        self.akc = akc
+        self.delay = delay
+        self._pending: List[Tuple[str, Dict, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._sync_pending: List[Tuple[str, Dict, concurrent.futures.Future]] = []
+
+    def __call__(
+        self,
+        action: str,
+        **params,
+        ) -> Union[asyncio.Future, concurrent.futures.Future]:
+        loop = asyncio._get_running_loop()
+        if loop is None:
+            future = concurrent.futures.Future()
+            self._sync_pending.append((action, params, future))
+            return future
+        future = loop.create_future()
+        self._pending.append((action, params, future))
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush())
+        return future
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(self.delay)
+        pending, self._pending, self._flush_task = self._pending, [], None
+        try:
+            results = await self.akc.__async_call__(
+                "multi",
+                actions=_multi_actions([(a, p) for a, p, _ in pending]),
+            )
+        except Exception as err:
+            results = err
+        _resolve(pending, results)
+
+    async def __aenter__(self) -> "BatchCollector":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        while self._flush_task is not None:
+            await self._flush_task
+
+    def __enter__(self) -> "BatchCollector":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        pending, self._sync_pending = self._sync_pending, []
+        if exc_type is not None or not pending:
+            for _, _, future in pending:
+                future.cancel()
+            return
         try:
-            data = json.loads(text)
+            results = self.akc._wait(
+                self.akc.__async_call__(
+                    "multi",
+                    actions=_multi_actions([(a, p) for a, p, _ in pending]),
+                )
+            )
         except Exception as err:
-            raise Exception(f"Failed to decode json output of response: '{err}'")
-        return data
+            results = err
+        _resolve(pending, results)
 
-# update the docstrings
-PyAnkiconnect.__sync_call__.__doc__ = PyAnkiconnect.__async_call__.__doc__
-PyAnkiconnect.__call__.__doc__ = PyAnkiconnect.__async_call__.__doc__
+
+def _resolve(
+    pending: List[Tuple[str, Dict, Union[asyncio.Future, concurrent.futures.Future]]],
+    results: Union[List[Dict], Exception],
+    ) -> None:
+    """
+    Set the result of each future of a batch from the results of its multi,
+    skipping the futures that were already cancelled by their caller.
+    """
+    if isinstance(results, Exception):
+        for _, _, future in pending:
+            if not future.done():
+                future.set_exception(results)
+        return
+    for (_, _, future), r in zip(pending, results):
+        if future.done():
+            continue
+        if r["error"] is not None:
+            future.set_exception(AnkiConnectError(r["error"]))
+        else:
+            future.set_result(r["result"])
@@ -1,4 +1,5 @@
 
+import os
 from setuptools import setup, find_packages
 from setuptools.command.install import install
 
@@ -13,6 +14,8 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/thiswillbeyourgithub/py_ankiconnect",
     packages=find_packages(),
+    # set PYANKICONNECT_NO_HELP to build without the help
+    package_data={"py_ankiconnect": [] if os.environ.get("PYANKICONNECT_NO_HELP") else ["help.md"]},
 
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -31,9 +34,14 @@ setup(
 
     install_requires=[
         "fire >= 0.6.0",
+        "aiohttp",
+        "yarl",
     ],
 
     extras_require={
         'rich': ['rich'],
+        'orjson': ['orjson'],
+        'ijson': ['ijson'],
+        'uvloop': ['uvloop; sys_platform != "win32"'],
     },
 )
@@ -0,0 +1,27 @@
+import asyncio
+
+from py_ankiconnect import PyAnkiconnect
+
+
+def test_cancelled_future_does_not_block_the_batch(monkeypatch):
+    async def fake_multi(self, action, **params):
+        await asyncio.sleep(0.05)
+        return [
+            {"result": a["action"], "error": None}
+            for a in params["actions"]
+        ]
+
+    monkeypatch.setattr(PyAnkiconnect, "__async_call__", fake_multi)
+    akc = PyAnkiconnect(force_async_mode=True)
+
+    async def main():
+        async with akc.batch() as b:
+            tags, decks = b("getTags"), b("deckNames")
+            try:
+                await asyncio.wait_for(tags, timeout=0.01)
+            except asyncio.TimeoutError:
+                pass
+            assert tags.cancelled()
+            return await asyncio.wait_for(decks, timeout=1)
+
+    assert asyncio.run(main()) == "deckNames"
@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from py_ankiconnect import PyAnkiconnect, AnkiConnectError
+
+
+def _send(monkeypatch, body):
+    async def fake_request(self, url, requestJson):
+        return body
+
+    monkeypatch.setattr(PyAnkiconnect, "_async_request", fake_request)
+    akc = PyAnkiconnect(force_async_mode=True)
+    return asyncio.run(akc("getTags"))
+
+
+def test_result_is_returned(monkeypatch):
+    assert _send(monkeypatch, b'{"result": ["a"], "error": null}') == ["a"]
+
+
+def test_error_is_raised(monkeypatch):
+    with pytest.raises(AnkiConnectError, match="boom"):
+        _send(monkeypatch, b'{"result": null, "error": "boom"}')
+
+
+@pytest.mark.parametrize("body", [b'[1, 2]', b'"text"', b'{"result": 1}'])
+def test_unexpected_response_is_described(monkeypatch, body):
+    with pytest.raises(Exception, match='should only have the fields "result" and "error"'):
+        _send(monkeypatch, body)